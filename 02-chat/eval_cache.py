@@ -0,0 +1,135 @@
+"""
+Offline evaluation of the semantic cache.
+
+The first question of every group is cached with its group id as the
+"response". Every other paraphrase should then hit its own group, and the
+unseen questions (same topics, different intent) should miss.
+
+    hit rate       = paraphrases that returned their own group / all paraphrases
+    false-hit rate = lookups that returned another group's answer / all lookups
+
+Usage:
+    python eval_cache.py                      # local embedder, threshold sweep
+    python eval_cache.py --embedder openai    # real embeddings (needs API key)
+    python eval_cache.py --index faiss        # HNSW index (needs faiss-cpu)
+"""
+import argparse
+
+from semantic_cache import (
+    BruteForceIndex,
+    FaissIndex,
+    SemanticCache,
+    local_embedder,
+    openai_embedder,
+)
+
+# -------------------------------
+# 1. Question Corpus
+# -------------------------------
+PARAPHRASE_GROUPS = [
+    [
+        "What is the difference between Docker and Kubernetes?",
+        "Explain Docker vs Kubernetes.",
+        "How do Docker and Kubernetes differ?",
+        "Docker and Kubernetes: what's the difference?",
+    ],
+    [
+        "What is a Python decorator?",
+        "Can you explain Python decorators?",
+        "How do decorators work in Python?",
+    ],
+    [
+        "How do I reverse a list in Python?",
+        "What's the way to reverse a Python list?",
+        "Reverse a list in Python, how?",
+    ],
+    [
+        "What is a REST API?",
+        "Explain what a REST API is.",
+        "Can you describe REST APIs?",
+    ],
+    [
+        "How does HTTPS keep data secure?",
+        "Why is HTTPS secure?",
+        "Explain how HTTPS secures data.",
+    ],
+    [
+        "What is the capital of France?",
+        "Tell me the capital city of France.",
+        "Which city is the capital of France?",
+    ],
+]
+
+# Questions that share words with the cached ones but ask something else.
+UNSEEN_QUESTIONS = [
+    "How do I install Docker on Ubuntu?",
+    "What is a Python generator?",
+    "How do I sort a list in Python?",
+    "What is a GraphQL API?",
+    "What is the capital of Germany?",
+    "How does SSH keep data secure?",
+]
+
+
+# -------------------------------
+# 2. Evaluation
+# -------------------------------
+def evaluate(embed, threshold, make_index=BruteForceIndex):
+    cache = SemanticCache(embed, threshold=threshold, index=make_index())
+    for group_id, group in enumerate(PARAPHRASE_GROUPS):
+        cache.put(group[0], group_id)
+
+    hits = false_hits = lookups = 0
+    for group_id, group in enumerate(PARAPHRASE_GROUPS):
+        for question in group[1:]:
+            lookups += 1
+            answer = cache.get(question)
+            if answer == group_id:
+                hits += 1
+            elif answer is not None:
+                false_hits += 1
+
+    paraphrases = lookups
+    for question in UNSEEN_QUESTIONS:
+        lookups += 1
+        if cache.get(question) is not None:
+            false_hits += 1
+
+    return hits / paraphrases, false_hits / lookups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the semantic cache.")
+    parser.add_argument("--embedder", choices=["local", "openai"], default="local")
+    parser.add_argument("--index", choices=["numpy", "faiss"], default="numpy")
+    parser.add_argument("--threshold", type=float, action="append")
+    args = parser.parse_args()
+
+    if args.embedder == "openai":
+        from dotenv import load_dotenv
+        from openai import OpenAI
+
+        load_dotenv()
+        embed = openai_embedder(OpenAI())
+    else:
+        embed = local_embedder()
+
+    make_index = BruteForceIndex
+    if args.index == "faiss":
+        dim = len(embed(PARAPHRASE_GROUPS[0][0]))
+        try:
+            FaissIndex(dim)
+        except ImportError as e:
+            print(f"Skipping faiss evaluation: {e}")
+            return
+        make_index = lambda: FaissIndex(dim)
+
+    thresholds = args.threshold or [0.5, 0.6, 0.7, 0.8, 0.9, 0.95]
+    print(f"{'threshold':>9}  {'hit rate':>8}  {'false-hit':>9}")
+    for threshold in thresholds:
+        hit_rate, false_hit_rate = evaluate(embed, threshold, make_index)
+        print(f"{threshold:>9.2f}  {hit_rate:>8.0%}  {false_hit_rate:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
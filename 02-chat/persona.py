@@ -2,6 +2,8 @@ import json
 from openai import OpenAI
 from dotenv import load_dotenv
 
+from semantic_cache import SemanticCache, openai_embedder
+
 load_dotenv()
 
 # -------------------------------
@@ -56,12 +58,43 @@ Remember:
 # -------------------------------
 client = OpenAI()
 
+# Paraphrased questions reuse an earlier answer instead of a new model call.
+# The 0.9 threshold is uncalibrated: tune it with `python eval_cache.py --embedder openai`.
+cache = SemanticCache(openai_embedder(client), threshold=0.9, max_size=500)
+
+
+def cache_get(query: str):
+    """Look up a cached answer; an empty query or embedding error is a miss."""
+    if not query:
+        return None
+    try:
+        return cache.get(query)
+    except Exception as e:
+        print(f"⚠️ Cache lookup failed: {e}")
+        return None
+
+
+def cache_put(query: str, answer: str):
+    """Store an answer; embedding errors are reported and otherwise ignored."""
+    if not query:
+        return
+    try:
+        cache.put(query, answer)
+    except Exception as e:
+        print(f"⚠️ Cache store failed: {e}")
+
 # -------------------------------
 # 3. Start the Conversation Loop
 # -------------------------------
 def run_persona():
     messages = [{ "role": "system", "content": SYSTEM_PROMPT }]
     query = input("> ").strip()
+
+    cached = cache_get(query)
+    if cached is not None:
+        print(f"🤖 {cached}  (cached)")
+        return
+
     messages.append({ "role": "user", "content": query })
 
     while True:
@@ -89,6 +122,7 @@ def run_persona():
         # Print formatted output
         if step == "result":
             print(f"🤖 {text}")
+            cache_put(query, text)
             break
         else:
             print(f"🧠 [{step}] {text}")
@@ -96,4 +130,5 @@ def run_persona():
 if __name__ == "__main__":
     print("✨ Persona Assistant (Nova) Ready!")
     print("Type your question below:")
-    run_persona()
+    while True:
+        run_persona()
@@ -0,0 +1,195 @@
+"""
+Semantic response cache keyed by embedding similarity.
+
+An exact-match cache misses paraphrases ("What is Docker?" vs "Can you explain
+Docker?"). Here every query is embedded, the nearest cached query is looked up
+in a vector index, and its response is reused when the cosine similarity is
+above a threshold.
+"""
+import hashlib
+import re
+from collections import OrderedDict
+
+import numpy as np
+
+# -------------------------------
+# 1. Embedders
+# -------------------------------
+def openai_embedder(client, model="text-embedding-3-small"):
+    """Embed text with the OpenAI embeddings API."""
+    def embed(text: str):
+        response = client.embeddings.create(model=model, input=text)
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
+    return embed
+
+
+STOPWORDS = {
+    "a", "an", "the", "is", "are", "was", "be", "do", "does", "can", "could",
+    "you", "me", "i", "my", "please", "what", "whats", "how", "why", "tell",
+    "explain", "describe", "about", "of", "to", "in", "on", "for", "and", "or",
+    "it", "its", "this", "that", "with", "between", "give", "some", "would",
+}
+
+
+def local_embedder(dim=512):
+    """
+    Offline stand-in for a real embedding model.
+
+    Hashes content words (minus stopwords and a trailing plural "s") into a
+    fixed-size bag-of-words vector. Good enough to exercise the cache and the
+    evaluation script without network access.
+    """
+    def embed(text: str):
+        vector = np.zeros(dim, dtype=np.float32)
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            if word in STOPWORDS:
+                continue
+            if len(word) > 3 and word.endswith("s"):
+                word = word[:-1]
+            digest = hashlib.md5(word.encode()).digest()
+            vector[int.from_bytes(digest[:4], "little") % dim] += 1.0
+        return vector
+    return embed
+
+
+def _normalise(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+# -------------------------------
+# 2. Vector Indexes
+# -------------------------------
+class BruteForceIndex:
+    """Exact cosine search over a NumPy matrix of normalised vectors."""
+
+    def __init__(self):
+        self.keys = []
+        self.vectors = None
+
+    def add(self, key, vector):
+        row = vector[np.newaxis, :]
+        self.vectors = row if self.vectors is None else np.vstack([self.vectors, row])
+        self.keys.append(key)
+
+    def remove(self, key):
+        i = self.keys.index(key)
+        self.keys.pop(i)
+        self.vectors = np.delete(self.vectors, i, axis=0)
+
+    def search(self, vector):
+        """Return (key, score) of the closest vector, or (None, -1.0)."""
+        if not self.keys:
+            return None, -1.0
+        scores = self.vectors @ vector
+        best = int(np.argmax(scores))
+        return self.keys[best], float(scores[best])
+
+
+class FaissIndex:
+    """
+    Approximate search with a FAISS HNSW graph (optional dependency).
+
+    HNSW cannot delete vectors, so evicted keys are skipped at search time and
+    the graph is rebuilt once they outnumber the live ones.
+    """
+
+    def __init__(self, dim, neighbours=32, k=8):
+        try:
+            import faiss
+        except ImportError as e:
+            raise ImportError("FaissIndex needs `pip install faiss-cpu`.") from e
+        self.faiss = faiss
+        self.dim = dim
+        self.neighbours = neighbours
+        self.k = k
+        self.live = {}
+        self._rebuild()
+
+    def _rebuild(self):
+        self.index = self.faiss.IndexHNSWFlat(
+            self.dim, self.neighbours, self.faiss.METRIC_INNER_PRODUCT
+        )
+        self.slots = []
+        for key, vector in self.live.items():
+            self.index.add(vector[np.newaxis, :])
+            self.slots.append(key)
+
+    def add(self, key, vector):
+        self.live[key] = vector
+        self.index.add(vector[np.newaxis, :])
+        self.slots.append(key)
+
+    def remove(self, key):
+        self.live.pop(key, None)
+        if len(self.slots) > 2 * len(self.live):
+            self._rebuild()
+
+    def search(self, vector):
+        if not self.live:
+            return None, -1.0
+        # Widen the search by the number of evicted slots still in the graph.
+        k = min(self.k + len(self.slots) - len(self.live), len(self.slots))
+        scores, ids = self.index.search(vector[np.newaxis, :], k)
+        for score, i in zip(scores[0], ids[0]):
+            if i >= 0 and self.slots[i] in self.live:
+                return self.slots[i], float(score)
+        return None, -1.0
+
+
+# -------------------------------
+# 3. The Cache
+# -------------------------------
+class SemanticCache:
+    """
+    Bounded LRU cache of responses, looked up by embedding similarity.
+
+    Args:
+        embed: callable mapping text to a 1-D vector
+        threshold: minimum cosine similarity that counts as a hit
+        max_size: number of entries kept before the least recently used is evicted
+        index: vector index with add/remove/search (defaults to BruteForceIndex)
+    """
+
+    def __init__(self, embed, threshold=0.9, max_size=1000, index=None):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_size = max_size
+        self.index = index if index is not None else BruteForceIndex()
+        self.entries = OrderedDict()
+        self.next_key = 0
+        self.hits = 0
+        self.misses = 0
+        self._last = (None, None)
+
+    def _vector(self, query: str):
+        if self._last[0] == query:
+            return self._last[1]
+        vector = _normalise(self.embed(query))
+        self._last = (query, vector)
+        return vector
+
+    def get(self, query: str):
+        """Return the cached response for a similar query, or None."""
+        key, score = self.index.search(self._vector(query))
+        if key is None or score < self.threshold:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key][1]
+
+    def put(self, query: str, response):
+        """Store a response, evicting the least recently used entry if full."""
+        vector = self._vector(query)
+        key = self.next_key
+        self.next_key += 1
+        self.entries[key] = (query, response)
+        self.index.add(key, vector)
+        while len(self.entries) > self.max_size:
+            old_key, _ = self.entries.popitem(last=False)
+            self.index.remove(old_key)
+
+    def __len__(self):
+        return len(self.entries)
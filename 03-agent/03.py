@@ -5,6 +5,8 @@ import json
 import os
 import requests
 
+from prefetch import SpeculativeExecutor
+
 load_dotenv()
 client = OpenAI()
 
@@ -39,11 +41,14 @@ SYSTEM_PROMPT = (
 
 
 # --- Main Loop ---
+# Set SPECULATIVE_PREFETCH=1 to start read-only tools during the plan step.
+speculator = SpeculativeExecutor(available_tools)
 messages = [{"role": "system", "content": SYSTEM_PROMPT}]
 
 while True:
     query = input("> ")
     messages.append({"role": "user", "content": query})
+    speculator.hint(query)
 
     while True:
         resp = client.chat.completions.create(
@@ -59,6 +64,7 @@ while True:
 
         if step == "plan":
             print("🧠:", data.get("content"))
+            speculator.hint(data.get("content"))
             continue
 
         if step == "action":
@@ -77,7 +83,7 @@ while True:
                 continue
 
             try:
-                output = available_tools[tool](tool_input)
+                output = speculator.run(tool, tool_input)
             except Exception as e:
                 output = f"Tool error: {e}"
 
@@ -89,6 +95,9 @@ while True:
 
         if step == "output":
             print("🤖:", data.get("content"))
+            stats = speculator.report()
+            if stats:
+                print("⚡", stats)
             break
 
         # Fallback for unexpected steps
@@ -6,6 +6,8 @@ import json
 import os
 import requests
 
+from prefetch import SpeculativeExecutor
+
 load_dotenv()
 client = OpenAI()
 
@@ -50,11 +52,14 @@ SYSTEM_PROMPT = (
 
 
 # --- Main Loop ---
+# Set SPECULATIVE_PREFETCH=1 to start read-only tools during the plan step.
+speculator = SpeculativeExecutor(available_tools)
 messages = [{"role": "system", "content": SYSTEM_PROMPT}]
 
 while True:
     query = input("> ")
     messages.append({"role": "user", "content": query})
+    speculator.hint(query)
 
     while True:
         resp = client.chat.completions.create(
@@ -70,6 +75,7 @@ while True:
 
         if step == "plan":
             print("🧠:", data.get("content"))
+            speculator.hint(data.get("content"))
             continue
 
         if step == "action":
@@ -81,7 +87,7 @@ while True:
                 obs = f"Unknown tool: {tool}"
             else:
                 try:
-                    obs = available_tools[tool](tool_input)
+                    obs = speculator.run(tool, tool_input)
                 except Exception as e:
                     obs = f"Tool error: {e}"
 
@@ -93,6 +99,9 @@ while True:
 
         if step == "output":
             print("🤖:", data.get("content"))
+            stats = speculator.report()
+            if stats:
+                print("⚡", stats)
             break
 
         # Fallback for unexpected steps
@@ -0,0 +1,135 @@
+# filename: prefetch.py
+"""
+Speculative tool prefetch for the plan → action → observe agents.
+
+While the model is busy with the extra round-trip between its `plan` step and
+its `action` step, we look for tool + argument hints in the plan text (or the
+user query) and start read-only tool calls in the background. When the
+`action` step arrives, the observation is often already waiting.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+import time
+
+
+# --- Hint Extractors ---
+# Each extractor takes free text and returns the tool inputs it guesses the
+# model will ask for. Only tools listed here (and marked read-only) are ever
+# prefetched, so commands with side effects are never run speculatively.
+
+_CITY_PATTERN = re.compile(
+    r"\b(?i:in|for|at|of)\s+([a-zA-Z][a-zA-Z]+(?:[ -][A-Z][a-zA-Z]+)*)"
+)
+
+# Words that follow "in/for/at/of" in plans but are never cities.
+_NOT_CITIES = {
+    "a", "an", "the", "my", "your", "this", "that", "it", "its", "there",
+    "here", "today", "now", "order", "json", "api", "celsius", "fahrenheit",
+    "get", "get_weather", "run_command", "weather", "city", "general",
+}
+
+
+def extract_weather_cities(text: str):
+    """
+    Guess city names from the sentences that talk about the weather.
+
+    The first word after in/for/at/of may be lowercase ("weather in paris");
+    later words of a multi-word city must be capitalised ("in New York").
+    """
+    cities = []
+    for sentence in re.split(r"[.!?\n]+", text):
+        if "weather" not in sentence.lower():
+            continue
+        for city in _CITY_PATTERN.findall(sentence):
+            if city.lower() not in _NOT_CITIES and city not in cities:
+                cities.append(city)
+    return cities
+
+
+hint_extractors = {
+    "get_weather": extract_weather_cities,
+}
+
+
+def _key(tool: str, tool_input):
+    return tool, str(tool_input).strip().lower()
+
+
+# --- Speculative Executor ---
+class SpeculativeExecutor:
+    """Run read-only tools ahead of time and hand out the results on demand."""
+
+    def __init__(self, tools: dict, read_only=("get_weather",), enabled=None, max_workers=4):
+        if enabled is None:
+            enabled = os.getenv("SPECULATIVE_PREFETCH", "0") == "1"
+        self.tools = tools
+        self.read_only = set(read_only)
+        self.enabled = enabled
+        self.pool = ThreadPoolExecutor(max_workers=max_workers) if enabled else None
+        self.pending = {}
+        self.durations = {}
+        self.hits = 0
+        self.misses = 0
+        self.unused = 0
+        self.saved = 0.0
+
+    def hint(self, text):
+        """Scan text for tool hints and start any matching read-only calls."""
+        if not self.enabled or not isinstance(text, str):
+            return
+        for tool, extract in hint_extractors.items():
+            if tool not in self.tools or tool not in self.read_only:
+                continue
+            for tool_input in extract(text):
+                self._submit(tool, tool_input)
+
+    def _submit(self, tool: str, tool_input):
+        key = _key(tool, tool_input)
+        if key in self.pending:
+            return
+        fn = self.tools[tool]
+
+        def timed():
+            start = time.perf_counter()
+            try:
+                return fn(tool_input)
+            finally:
+                self.durations[key] = time.perf_counter() - start
+
+        self.pending[key] = self.pool.submit(timed)
+
+    def run(self, tool: str, tool_input):
+        """Return the tool output, using a prefetched result when one exists."""
+        prefetchable = tool in self.read_only and tool in hint_extractors
+        if not self.enabled or not prefetchable:
+            return self.tools[tool](tool_input)
+
+        future = self.pending.pop(_key(tool, tool_input), None)
+        if future is None:
+            self.misses += 1
+            return self.tools[tool](tool_input)
+
+        self.hits += 1
+        wait_start = time.perf_counter()
+        try:
+            return future.result()
+        finally:
+            waited = time.perf_counter() - wait_start
+            duration = self.durations.pop(_key(tool, tool_input), waited)
+            self.saved += max(duration - waited, 0.0)
+
+    def report(self):
+        """Summarise session hit-rate and latency saved, then drop unused prefetches."""
+        if not self.enabled:
+            return None
+        self.unused += len(self.pending)
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return (
+            f"prefetch hits={self.hits} misses={self.misses} unused={self.unused} "
+            f"hit-rate={rate:.0f}% saved={self.saved:.2f}s"
+        )